@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import cache, lru_cache
+from weakref import WeakKeyDictionary
 
 from habluetooth import HaBluetoothConnector
 
@@ -19,6 +22,40 @@ from .const import (
 
 LOGGER = logging.getLogger(__name__)
 
+# BLE script id per device, avoids listing scripts on every start/stop
+_BLE_SCRIPT_IDS: WeakKeyDictionary[RpcDevice, int] = WeakKeyDictionary()
+# Hash of the BLE script code known to be on the device, avoids reading it back
+_BLE_SCRIPT_CODE_HASHES: WeakKeyDictionary[RpcDevice, int] = WeakKeyDictionary()
+
+
+@cache
+def _ble_code_parts() -> tuple[str, ...]:
+    """Split BLE_CODE into literal segments and variable names.
+
+    Not using format strings here because the script code contains
+    curly braces. The variable names are at the odd indexes. Done on
+    first use so importing without starting a scanner stays cheap.
+    """
+    return tuple(
+        re.split(
+            f"({'|'.join(map(re.escape, (VAR_ACTIVE, VAR_EVENT_TYPE, VAR_VERSION)))})",
+            BLE_CODE,
+        )
+    )
+
+
+@lru_cache(maxsize=16)
+def _render_ble_code(active: bool, event_type: str, data_version: int) -> str:
+    """Render BLE_CODE with the script variables substituted."""
+    values = {
+        VAR_ACTIVE: "true" if active else "false",
+        VAR_EVENT_TYPE: event_type,
+        VAR_VERSION: str(data_version),
+    }
+    parts = list(_ble_code_parts())
+    parts[1::2] = [values[var] for var in parts[1::2]]
+    return "".join(parts)
+
 
 async def _async_get_scripts_by_name(device: RpcDevice) -> dict[str, int]:
     """Get scripts by name."""
@@ -26,10 +63,36 @@ async def _async_get_scripts_by_name(device: RpcDevice) -> dict[str, int]:
     return {script["name"]: script["id"] for script in scripts}
 
 
+async def _async_get_ble_script_id(device: RpcDevice) -> int | None:
+    """Get the BLE script id, listing the scripts only on a cache miss."""
+    if (script_id := _BLE_SCRIPT_IDS.get(device)) is None:
+        script_name_to_id = await _async_get_scripts_by_name(device)
+        if (script_id := script_name_to_id.get(BLE_SCRIPT_NAME)) is not None:
+            _BLE_SCRIPT_IDS[device] = script_id
+    return script_id
+
+
+def _clear_ble_script_cache(device: RpcDevice) -> None:
+    """Clear cached BLE script data, the script may have been removed."""
+    _BLE_SCRIPT_IDS.pop(device, None)
+    _BLE_SCRIPT_CODE_HASHES.pop(device, None)
+
+
 async def async_stop_scanner(device: RpcDevice) -> None:
     """Stop scanner."""
-    script_name_to_id = await _async_get_scripts_by_name(device)
-    if script_id := script_name_to_id.get(BLE_SCRIPT_NAME):
+    # Script code may be edited while stopped, check it again on next start
+    _BLE_SCRIPT_CODE_HASHES.pop(device, None)
+    if (script_id := _BLE_SCRIPT_IDS.get(device)) is not None:
+        try:
+            await device.script_stop(script_id)
+        except RpcCallError:
+            # Cached id may be stale, look the script up again below
+            _clear_ble_script_cache(device)
+        else:
+            return
+
+    # A script that no longer exists is already stopped
+    if script_id := await _async_get_ble_script_id(device):
         await device.script_stop(script_id)
 
 
@@ -37,35 +100,58 @@ async def async_start_scanner(
     device: RpcDevice, active: bool, event_type: str, data_version: int
 ) -> None:
     """Start scanner."""
-    script_name_to_id = await _async_get_scripts_by_name(device)
-    if BLE_SCRIPT_NAME not in script_name_to_id:
-        await device.script_create(BLE_SCRIPT_NAME)
-        script_name_to_id = await _async_get_scripts_by_name(device)
-
-    ble_script_id = script_name_to_id[BLE_SCRIPT_NAME]
+    if (ble_script_id := _BLE_SCRIPT_IDS.get(device)) is not None:
+        try:
+            await _async_start_script(
+                device, ble_script_id, active, event_type, data_version
+            )
+        except RpcCallError:
+            # Cached id may be stale, look the script up again below
+            _clear_ble_script_cache(device)
+        else:
+            return
+
+    if (ble_script_id := await _async_get_ble_script_id(device)) is None:
+        ble_script_id = await device.script_create(BLE_SCRIPT_NAME)
+        _BLE_SCRIPT_IDS[device] = ble_script_id
 
-    # Not using format strings here because the script
-    # code contains curly braces
-    code = (
-        BLE_CODE.replace(VAR_ACTIVE, "true" if active else "false")
-        .replace(VAR_EVENT_TYPE, event_type)
-        .replace(VAR_VERSION, str(data_version))
-    )
-
-    needs_putcode = False
     try:
-        code_response = await device.script_getcode(ble_script_id)
+        await _async_start_script(
+            device, ble_script_id, active, event_type, data_version
+        )
     except RpcCallError:
-        # Script has no code yet
-        needs_putcode = True
-    else:
-        needs_putcode = code_response["data"] != code
-
-    if needs_putcode:
-        # Avoid writing the flash unless we actually need to
-        # update the script
-        await device.script_stop(ble_script_id)
-        await device.script_putcode(ble_script_id, code)
+        _clear_ble_script_cache(device)
+        raise
+
+
+async def _async_start_script(
+    device: RpcDevice,
+    ble_script_id: int,
+    active: bool,
+    event_type: str,
+    data_version: int,
+) -> None:
+    """Update the BLE script code if needed and start it."""
+    code = _render_ble_code(active, event_type, data_version)
+
+    code_hash = hash(code)
+    if _BLE_SCRIPT_CODE_HASHES.get(device) != code_hash:
+        needs_putcode = False
+        try:
+            code_response = await device.script_getcode(ble_script_id)
+        except RpcCallError:
+            # Script has no code yet
+            needs_putcode = True
+        else:
+            needs_putcode = code_response["data"] != code
+
+        if needs_putcode:
+            # Avoid writing the flash unless we actually need to
+            # update the script
+            await device.script_stop(ble_script_id)
+            await device.script_putcode(ble_script_id, code)
+
+        _BLE_SCRIPT_CODE_HASHES[device] = code_hash
 
     await device.script_start(ble_script_id)
 
@@ -9,21 +9,33 @@ from bluetooth_data_tools import monotonic_time_coarse
 from habluetooth import BaseHaRemoteScanner
 
 from ..const import BLE_SCAN_RESULT_EVENT
-from ..parser import parse_ble_scan_result_event
+from ..parser import BLE_SCAN_RESULT_VERSIONS, parse_ble_scan_result_event
 
 LOGGER = logging.getLogger(__name__)
 
+# Only merged into a new dict by habluetooth, never mutated. Must be a
+# plain dict since the compiled base scanner types the argument as dict.
+_EMPTY_DETAILS: dict[str, Any] = {}
+
 
 class ShellyBLEScanner(BaseHaRemoteScanner):
     """Scanner for shelly."""
 
     def async_on_event(self, event: dict[str, Any]) -> None:
         """Process an event from the shelly and ignore if its not a ble.scan_result."""
-        if event.get("event") != BLE_SCAN_RESULT_EVENT:
+        try:
+            if event["event"] != BLE_SCAN_RESULT_EVENT:
+                return
+        except KeyError:
             return
 
         try:
-            parsed_advs = parse_ble_scan_result_event(event["data"])
+            data = event["data"]
+            if (version := data[0]) not in BLE_SCAN_RESULT_VERSIONS:
+                # Checked up front to skip raising and logging a traceback
+                LOGGER.error("Unsupported BLE scan result version: %s", version)
+                return
+            parsed_advs = parse_ble_scan_result_event(data)
         except Exception as err:
             # Broad exception catch because we have no
             # control over the data that is coming in.
@@ -31,11 +43,12 @@ class ShellyBLEScanner(BaseHaRemoteScanner):
             return
 
         now = monotonic_time_coarse()
+        on_advertisement = self._async_on_advertisement
         for address, rssi, parsed in parsed_advs:
-            self._async_on_advertisement(
+            on_advertisement(
                 address,
                 rssi,
                 *parsed,
-                {},
+                _EMPTY_DETAILS,
                 now,
             )
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 from binascii import a2b_base64
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from bluetooth_data_tools import parse_advertisement_data_tuple
@@ -14,17 +16,54 @@ BLEGAPAdvertisementTupleType = tuple[
 
 LOGGER = logging.getLogger(__name__)
 
+# Cleared when full to bound growth from spoofed/random addresses
+_MAX_UPPER_CACHE_SIZE = 512
+_UPPER_CACHE: dict[str, str] = {}
+
 
 def parse_ble_scan_result_event(
     data: list[Any],
 ) -> list[tuple[str, int, BLEGAPAdvertisementTupleType]]:
     """Parse BLE scan result event."""
     version: int = data[0]
-    if version == 1:
-        return _parse_v1(data)
-    if version == 2:  # noqa: PLR2004
-        return _parse_v2(data[1])
-    raise ValueError(f"Unsupported BLE scan result version: {version}")
+    if (parser := _PARSERS.get(version)) is None:
+        raise ValueError(f"Unsupported BLE scan result version: {version}")
+    return parser(data)
+
+
+def _upper(address: str) -> str:
+    """Return the upper-cased address, cached for repeating advertisers."""
+    if (upper := _UPPER_CACHE.get(address)) is None:
+        if len(_UPPER_CACHE) >= _MAX_UPPER_CACHE_SIZE:
+            _UPPER_CACHE.clear()
+        upper = _UPPER_CACHE[address] = address.upper()
+    return upper
+
+
+def _decode_pair(advertisement_data_b64: str, scan_response_b64: str) -> tuple[bytes]:
+    """Decode the base64 advertisement and scan response into one payload.
+
+    When the advertisement ends on an unpadded base64 block boundary both
+    parts can be decoded with a single call, otherwise they are decoded
+    separately and joined.
+    """
+    if not len(advertisement_data_b64) & 3 and not advertisement_data_b64.endswith("="):
+        return (a2b_base64(advertisement_data_b64 + scan_response_b64),)
+    return (a2b_base64(advertisement_data_b64) + a2b_base64(scan_response_b64),)
+
+
+@lru_cache(maxsize=256)
+def _parse_advertisement(
+    advertisement_data_b64: str, scan_response_b64: str
+) -> BLEGAPAdvertisementTupleType:
+    """Decode and parse an advertisement, cached for repeated payloads.
+
+    Keyed on the base64 strings so repeated packets skip the decode as well.
+    The parsed containers are shared and must be treated as read-only.
+    """
+    return parse_advertisement_data_tuple(
+        _decode_pair(advertisement_data_b64, scan_response_b64)
+    )
 
 
 def _parse_v1(adv: list[Any]) -> list[tuple[str, int, BLEGAPAdvertisementTupleType]]:
@@ -32,32 +71,30 @@ def _parse_v1(adv: list[Any]) -> list[tuple[str, int, BLEGAPAdvertisementTupleTy
     _, address, rssi, advertisement_data_b64, scan_response_b64 = adv
     return [
         (
-            address.upper(),
+            _upper(address),
             rssi,
-            parse_advertisement_data_tuple(
-                (
-                    a2b_base64(advertisement_data_b64.encode("ascii")),
-                    a2b_base64(scan_response_b64.encode("ascii")),
-                )
-            ),
+            _parse_advertisement(advertisement_data_b64, scan_response_b64),
         )
     ]
 
 
-def _parse_v2(
-    advs: list[list[Any]],
-) -> list[tuple[str, int, BLEGAPAdvertisementTupleType]]:
+def _parse_v2(data: list[Any]) -> list[tuple[str, int, BLEGAPAdvertisementTupleType]]:
     """Convert v2 format to a list of ble tuples."""
+    advs: list[list[Any]] = data[1]
+    # Bind once, the comprehension runs for every advertisement in the batch
+    upper = _upper
+    parse_adv = _parse_advertisement
     return [
         (
-            address.upper(),
+            upper(address),
             rssi,
-            parse_advertisement_data_tuple(
-                (
-                    a2b_base64(advertisement_data_b64.encode("ascii")),
-                    a2b_base64(scan_response_b64.encode("ascii")),
-                )
-            ),
+            parse_adv(advertisement_data_b64, scan_response_b64),
         )
         for address, rssi, advertisement_data_b64, scan_response_b64 in advs
     ]
+
+
+_PARSERS: dict[
+    int, Callable[[list[Any]], list[tuple[str, int, BLEGAPAdvertisementTupleType]]]
+] = {1: _parse_v1, 2: _parse_v2}
+BLE_SCAN_RESULT_VERSIONS = frozenset(_PARSERS)
@@ -8,6 +8,7 @@ import socket
 import struct
 from collections.abc import Callable
 from enum import Enum, auto
+from functools import cache, lru_cache
 from ipaddress import IPv4Address
 from types import TracebackType
 from typing import TYPE_CHECKING, Self, cast
@@ -16,6 +17,15 @@ from ..const import DEFAULT_COAP_PORT, END_OF_OPTIONS_MARKER, PERIODIC_COAP_TYPE
 from ..json import JSONDecodeError, json_loads
 
 COAP_OPTION_DEVICE_ID = 3332
+# Many devices report at the same time, a larger receive buffer avoids
+# the kernel silently dropping datagrams. Linux caps the requested size
+# at net.core.rmem_max.
+COAP_RECEIVE_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Shelly sends periodic (30) and reply (69, 2.05 Content) messages only
+_VALID_CODES = frozenset((PERIODIC_COAP_TYPE_CODE, 69))
+_UNPACK_HEADER = struct.Struct("!BBH").unpack_from
+_UNPACK_UINT16 = struct.Struct("!H").unpack_from
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,82 +48,133 @@ class CoapType(Enum):
 class CoapMessage:
     """Represents a received coap message."""
 
+    __slots__ = (
+        "coap_type",
+        "code",
+        "ip",
+        "mid",
+        "options",
+        "payload",
+        "port",
+        "vttkl",
+    )
+
     def __init__(self, sender_addr: tuple[str, int], payload: bytes) -> None:
         """Initialize a coap message."""
+        self._parse_payload(self._parse_header(sender_addr, payload), payload)
+
+    @classmethod
+    def _from_datagram(
+        cls, sender_addr: tuple[str, int], payload: bytes
+    ) -> tuple[Self, bytes]:
+        """Parse only the header and options of a received datagram.
+
+        Returns the message and its undecoded data, _parse_payload() must
+        be called before the message is handed out.
+        """
+        msg = cls.__new__(cls)
+        return msg, cls._parse_header(msg, sender_addr, payload)
+
+    def _parse_header(self, sender_addr: tuple[str, int], payload: bytes) -> bytes:
+        """Parse the header and options, return the undecoded data."""
         self.ip = sender_addr[0]
         self.port = sender_addr[1]
         self.options: dict[int, bytes] = {}
         self.coap_type = CoapType.REPLY
 
         try:
-            self.vttkl, self.code, self.mid = struct.unpack("!BBH", payload[:4])
+            self.vttkl, self.code, self.mid = _UNPACK_HEADER(payload)
         except struct.error as err:
             raise InvalidMessage("Message too short") from err
 
-        if self.code not in (30, 69):
+        if self.code not in _VALID_CODES:
             raise InvalidMessage(f"Wrong type, {self.code}")
 
-        raw_data = payload[4:]
+        # Walk the options with an offset, only the option values and
+        # the data are sliced out of the payload
+        pos = 4
+        end = len(payload)
         option_number = 0
         data = b""
 
         # parse options
-        while raw_data:
-            if raw_data[0] == END_OF_OPTIONS_MARKER:
-                data = raw_data[1:]
+        while pos < end:
+            if (header := payload[pos]) == END_OF_OPTIONS_MARKER:
+                data = payload[pos + 1 :]
                 break
 
-            delta = (raw_data[0] & 0xF0) >> 4
-            length = raw_data[0] & 0x0F
-            (delta, raw_data) = self._read_extended_field_value(delta, raw_data[1:])
-            (length, raw_data) = self._read_extended_field_value(length, raw_data)
+            delta, pos = self._read_extended_field_value(header >> 4, payload, pos + 1)
+            length, pos = self._read_extended_field_value(header & 0x0F, payload, pos)
             option_number += delta
 
-            if len(raw_data) < length:
+            if end - pos < length:
                 raise InvalidMessage("Option announced but absent")
 
-            self.options[option_number] = raw_data[:length]
-            raw_data = raw_data[length:]
+            self.options[option_number] = payload[pos : pos + length]
+            pos += length
 
         if not data:
             raise InvalidMessage("Received message without data")
 
+        if self.code == PERIODIC_COAP_TYPE_CODE:
+            self.coap_type = CoapType.PERIODIC
+
+        return data
+
+    def _parse_payload(self, data: bytes, payload: bytes) -> None:
+        """Parse the JSON data of the message."""
         try:
-            self.payload = json_loads(data.decode())
-        except (JSONDecodeError, UnicodeDecodeError) as err:
+            # orjson parses (and validates UTF-8 of) bytes directly
+            self.payload = json_loads(data)
+        except JSONDecodeError as err:
             raise InvalidMessage(
                 f"Message type {self.code} is not a valid JSON format: {payload!s}"
             ) from err
 
-        if self.code == PERIODIC_COAP_TYPE_CODE:
-            self.coap_type = CoapType.PERIODIC
-
-        _LOGGER.debug(
-            "CoapMessage: ip=%s, type=%s(%s), options=%s, payload=%s",
-            self.ip,
-            self.coap_type,
-            self.code,
-            self.options,
-            self.payload,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "CoapMessage: ip=%s, type=%s(%s), options=%s, payload=%s",
+                self.ip,
+                self.coap_type,
+                self.code,
+                self.options,
+                self.payload,
+            )
 
     @staticmethod
-    def _read_extended_field_value(value: int, raw_data: bytes) -> tuple[int, bytes]:
-        """Decode large values of option delta and option length."""
+    def _read_extended_field_value(
+        value: int, payload: bytes, pos: int
+    ) -> tuple[int, int]:
+        """Decode large values of option delta and option length.
+
+        Returns the decoded value and the offset following it.
+        """
         if 0 <= value < 13:  # noqa: PLR2004
-            return (value, raw_data)
+            return (value, pos)
         if value == 13:  # noqa: PLR2004
-            if len(raw_data) < 1:
+            if len(payload) - pos < 1:
                 raise InvalidMessage("Option ended prematurely")
-            return (raw_data[0] + 13, raw_data[1:])
+            return (payload[pos] + 13, pos + 1)
         if value == 14:  # noqa: PLR2004
-            if len(raw_data) < 2:  # noqa: PLR2004
+            if len(payload) - pos < 2:  # noqa: PLR2004
                 raise InvalidMessage("Option ended prematurely")
-            return (int.from_bytes(raw_data[:2], "big") + 269, raw_data[2:])
+            return (_UNPACK_UINT16(payload, pos)[0] + 269, pos + 2)
 
         raise InvalidMessage("Option contained partial payload marker.")
 
 
+@cache
+def _cit_request(path: str) -> bytes:
+    """Return the encoded 'cit/<path>' request, built once per path."""
+    return b"\x50\x01\x00\x0a\xb3cit\x01" + path.encode() + b"\xff\x00"
+
+
+@lru_cache(maxsize=256)
+def _device_id_from_option(option: bytes) -> str:
+    """Return the short device id, devices repeat the same option value."""
+    return option.decode().split("#", 2)[1][-6:]
+
+
 def socket_init(
     socket_port: int = DEFAULT_COAP_PORT,
     socket_ips: list[IPv4Address] | None = None,
@@ -121,6 +182,10 @@ def socket_init(
     """Init UDP socket to send/receive data with Shelly devices."""
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, COAP_RECEIVE_BUFFER_SIZE)
+    except OSError as err:
+        _LOGGER.debug("Failed to set socket receive buffer size: %r", err)
     sock.bind(("", socket_port))
     sock.setblocking(False)
     multicast_ip_bytes = socket.inet_aton("224.0.1.187")
@@ -180,7 +245,7 @@ class COAP(asyncio.DatagramProtocol):
         if TYPE_CHECKING:
             assert self.transport is not None
 
-        msg = b"\x50\x01\x00\x0a\xb3cit\x01" + path.encode() + b"\xff\x00"
+        msg = _cit_request(path)
         _LOGGER.debug("Sending request 'cit/%s' to device %s", path, ip)
         self.transport.sendto(msg, (ip, 5683))
 
@@ -196,8 +261,24 @@ class COAP(asyncio.DatagramProtocol):
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
         """Handle incoming datagram messages."""
         host_ip = addr[0]
+        # Cheap reject of other UDP traffic on the port before parsing
+        if len(data) < 4 or data[1] not in _VALID_CODES:  # noqa: PLR2004
+            _LOGGER.debug("Ignoring non Shelly CoAP message from host %s", host_ip)
+            return
+
+        try:
+            # Defer the JSON payload until we know someone wants the message
+            msg, body = CoapMessage._from_datagram(addr, data)  # noqa: SLF001
+        except InvalidMessage as err:
+            _LOGGER.debug("Invalid Message from host %s: %s", host_ip, err)
+            return
+
+        callback = self._get_subscription(msg)
+        if callback is None and not self._message_received:
+            return
+
         try:
-            msg = CoapMessage(addr, data)
+            msg._parse_payload(body, data)  # noqa: SLF001
         except InvalidMessage as err:
             _LOGGER.debug("Invalid Message from host %s: %s", host_ip, err)
             return
@@ -205,24 +286,27 @@ class COAP(asyncio.DatagramProtocol):
         if self._message_received:
             self._message_received(msg)
 
-        if COAP_OPTION_DEVICE_ID not in msg.options:
-            _LOGGER.debug("Message from host %s missing device id option", host_ip)
-            return
+        if callback is not None:
+            _LOGGER.debug("Calling CoAP message update for host %s", host_ip)
+            callback(msg)
+
+    def _get_subscription(self, msg: CoapMessage) -> Callable | None:
+        """Return the subscribed callback for a message by device id or host."""
+        if (device_id_option := msg.options.get(COAP_OPTION_DEVICE_ID)) is None:
+            _LOGGER.debug("Message from host %s missing device id option", msg.ip)
+            return None
 
         try:
-            device_id = msg.options[COAP_OPTION_DEVICE_ID].decode().split("#")[1][-6:]
+            device_id = _device_id_from_option(device_id_option)
         except (UnicodeDecodeError, IndexError) as err:
-            _LOGGER.debug("Invalid device id from host %s: %s", host_ip, err)
-            return
+            _LOGGER.debug("Invalid device id from host %s: %s", msg.ip, err)
+            return None
 
-        if device_id in self.subscriptions:
-            _LOGGER.debug("Calling CoAP message update for device id %s", device_id)
-            self.subscriptions[device_id](msg)
-            return
+        subscriptions = self.subscriptions
+        if (callback := subscriptions.get(device_id)) is not None:
+            return callback
 
-        if msg.ip in self.subscriptions:
-            _LOGGER.debug("Calling CoAP message update for host %s", msg.ip)
-            self.subscriptions[msg.ip](msg)
+        return subscriptions.get(msg.ip)
 
     def subscribe_updates(
         self, ip_or_device_id: str, message_received: Callable
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+import sys
+from collections import defaultdict
+from collections.abc import Callable, Mapping
 from enum import Enum, auto
 from http import HTTPStatus
+from types import MappingProxyType
 from typing import Any, ClassVar, cast
 
 from aiohttp import ClientResponse, ClientResponseError, ClientSession, ClientTimeout
@@ -25,6 +28,7 @@ from ..const import (
     DEVICE_IO_TIMEOUT,
     HTTP_CALL_TIMEOUT,
     MODEL_RGBW2,
+    UNDEFINED,
 )
 from ..exceptions import (
     CustomPortNotSupported,
@@ -84,6 +88,9 @@ class BlockDevice:
         self.coap_context: COAP = coap_context
         self.aiohttp_session: ClientSession = aiohttp_session
         self.options: ConnectionOptions = options
+        self._base_url = URL.build(scheme="http", host=options.ip_address)
+        # Devices are polled on a small fixed set of paths
+        self._urls: dict[str, URL] = {}
         self.coap_d: dict[str, Any] | None = None
         self.blocks: list[Block] = []
         self.coap_s: dict[str, Any] | None = None
@@ -156,21 +163,24 @@ class BlockDevice:
             if self.requires_auth and not self.options.auth:
                 raise InvalidAuthError("auth missing and required")
 
-            async with asyncio.timeout(DEVICE_IO_TIMEOUT):
-                await self.update_settings()
-                await self.update_status()
-
-                # Older devices has incompatible CoAP protocol (v1)
-                # Skip CoAP to avoid parsing errors
-                if self.firmware_supported:
-                    event_d = await self._coap_request("d")
-                    # We need to wait for D to come in before we request S
-                    # Or else we might miss the answer to D
-                    await event_d.wait()
+            # HTTP and CoAP calls are independent, run them concurrently
+            tasks = [
+                asyncio.create_task(self.update_settings()),
+                asyncio.create_task(self.update_status()),
+            ]
+            # Older devices has incompatible CoAP protocol (v1)
+            # Skip CoAP to avoid parsing errors
+            if self.firmware_supported:
+                tasks.append(asyncio.create_task(self._coap_initialize()))
 
-                    if self.coap_s is None:
-                        event_s = await self._coap_request("s")
-                        await event_s.wait()
+            try:
+                async with asyncio.timeout(DEVICE_IO_TIMEOUT):
+                    await asyncio.gather(*tasks)
+            finally:
+                # Do not leave calls running if one of them failed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
             self.initialized = True
         except ClientResponseError as err:
@@ -198,6 +208,17 @@ class BlockDevice:
         if self._update_listener:
             self._update_listener(self, BlockUpdateType.INITIALIZED)
 
+    async def _coap_initialize(self) -> None:
+        """Fetch CoAP description and status."""
+        event_d = await self._coap_request("d")
+        # We need to wait for D to come in before we request S
+        # Or else we might miss the answer to D
+        await event_d.wait()
+
+        if self.coap_s is None:
+            event_s = await self._coap_request("s")
+            await event_s.wait()
+
     async def shutdown(self) -> None:
         """Shutdown device."""
         _LOGGER.debug("host %s: block device shutdown", self.ip_address)
@@ -217,20 +238,19 @@ class BlockDevice:
         if not self._initializing and not self.initialized and self._update_listener:
             self._update_listener(self, BlockUpdateType.ONLINE)
 
-        if not msg.payload:
+        if not (payload := msg.payload):
             return
-        if "G" in msg.payload:
-            self._update_s(msg.payload, msg.coap_type)
+        if "G" in payload:
+            self._update_s(payload, msg.coap_type)
             path = "s"
-        elif "blk" in msg.payload:
-            self._update_d(msg.payload)
+        elif "blk" in payload:
+            self._update_d(payload)
             path = "d"
         else:
             # Unknown msg
             return
 
-        event = self._coap_response_events.pop(path, None)
-        if event is not None:
+        if (event := self._coap_response_events.get(path)) is not None:
             event.set()
 
     async def update(self) -> None:
@@ -248,21 +268,23 @@ class BlockDevice:
 
     def _update_d(self, data: dict[str, Any]) -> None:
         """Device update from cit/d call."""
+        # The description is static unless the firmware or settings
+        # changed, keep the existing blocks when it is unchanged
+        if data == self.coap_d:
+            return
+
         self.coap_d = data
         blocks = []
 
-        for blk in self.coap_d["blk"]:
-            blk_index = blk["I"]
-            blk_sensors = {
-                val["I"]: val
-                for val in self.coap_d["sen"]
-                if (
-                    val["L"] == blk_index
-                    if isinstance(val["L"], int)
-                    else blk_index in val["L"]
-                )
-            }
-            block = Block.create(self, blk, blk_sensors)
+        # Bucket sensors by the block indexes they link to in a single pass
+        blk_sensors: defaultdict[int, dict[str, dict]] = defaultdict(dict)
+        for val in data["sen"]:
+            links = val["L"]
+            for blk_index in (links,) if isinstance(links, int) else links:
+                blk_sensors[blk_index][val["I"]] = val
+
+        for blk in data["blk"]:
+            block = Block.create(self, blk, blk_sensors.get(blk["I"], {}))
 
             if block:
                 blocks.append(block)
@@ -271,7 +293,7 @@ class BlockDevice:
 
     def _update_s(self, data: dict[str, Any], coap_type: CoapType) -> None:
         """Device update from cit/s call."""
-        self.coap_s = {info[1]: info[2] for info in data["G"]}
+        self.coap_s = {index: value for _, index, value in data["G"]}
 
         if self._update_listener and self.initialized:
             if coap_type is CoapType.PERIODIC:
@@ -298,10 +320,11 @@ class BlockDevice:
 
     async def _coap_request(self, path: str) -> asyncio.Event:
         """Device CoAP request."""
-        if path not in self._coap_response_events:
-            self._coap_response_events[path] = asyncio.Event()
-
-        event: asyncio.Event = self._coap_response_events[path]
+        if (event := self._coap_response_events.get(path)) is None:
+            event = self._coap_response_events[path] = asyncio.Event()
+        else:
+            # Events are reused between requests, reset to wait for the new reply
+            event.clear()
 
         await self.coap_context.request(self.ip_address, path)
         return event
@@ -315,12 +338,14 @@ class BlockDevice:
 
         host = self.options.ip_address
         _LOGGER.debug("host %s: http request: /%s (params=%s)", host, path, params)
+        if (url := self._urls.get(path)) is None:
+            url = self._urls[path] = self._base_url.with_path(f"/{path}")
         try:
             resp: ClientResponse = await self.aiohttp_session.request(
                 method,
-                URL.build(scheme="http", host=host, path=f"/{path}"),
+                url,
                 params=params,
-                auth=self.options.auth,
+                headers=self.options._auth_header,  # noqa: SLF001
                 raise_for_status=True,
                 timeout=HTTP_CALL_TIMEOUT_CLIENT_TIMEOUT,
             )
@@ -475,36 +500,54 @@ class BlockDevice:
         return is_firmware_supported(self.gen, self.model, self.firmware_version)
 
 
+_BLOCK_TYPES: dict[str, type[Block]] = {}
+
+
 class Block:
     """Shelly CoAP block."""
 
-    TYPES: ClassVar[dict] = {}
-    type = None
+    __slots__ = (
+        "_channel",
+        "_sensor_items",
+        "blk",
+        "device",
+        "sensor_ids",
+        "sensors",
+        "type",
+    )
+
+    # Read-only view of the registered block types
+    TYPES: ClassVar[Mapping[str, type[Block]]] = MappingProxyType(_BLOCK_TYPES)
 
     def __init_subclass__(cls, blk_type: str = "", **kwargs: Any) -> None:
         """Initialize a subclass, register if possible."""
         super().__init_subclass__(**kwargs)
-        Block.TYPES[blk_type] = cls
+        _BLOCK_TYPES[blk_type] = cls
 
     @staticmethod
     def create(device: BlockDevice, blk: dict, sensors: dict[str, dict]) -> Any:
         """Block create."""
-        blk_type = blk["D"].split("_")[0]
-        cls = Block.TYPES.get(blk_type, Block)
+        blk_type = blk["D"].partition("_")[0]
+        cls = _BLOCK_TYPES.get(blk_type, Block)
         return cls(device, blk_type, blk, sensors)
 
     def __init__(
         self, device: BlockDevice, blk_type: str, blk: dict, sensors: dict[str, dict]
     ) -> None:
         """Block initialize."""
-        self.type = blk_type
+        self.type = sys.intern(blk_type)
         self.device = device
         self.blk = blk
         self.sensors = sensors
-        sensor_ids = {}
+        _, has_channel, channel = blk["D"].partition("_")
+        self._channel = sys.intern(channel.partition("_")[0]) if has_channel else None
+        sensor_ids: dict[str, Any] = {}
         for sensor in sensors.values():
-            if sensor["D"] not in sensor_ids:
-                sensor_ids[sensor["D"]] = sensor["I"]
+            # Descriptions are looked up by attribute name in __getattr__,
+            # interning them lets the dict lookup match by identity
+            desc = sys.intern(sensor["D"])
+            # Single dict operation for the common case of a unique description
+            if sensor_ids.setdefault(desc, sensor_id := sensor["I"]) == sensor_id:
                 continue
 
             if sensor[BLOCK_VALUE_TYPE] != BLOCK_VALUE_TYPE_TEMPERATURE:
@@ -513,9 +556,10 @@ class Block:
                 )
 
             if sensor[BLOCK_VALUE_UNIT] == device.options.temperature_unit:
-                sensor_ids[sensor["D"]] = sensor["I"]
+                sensor_ids[desc] = sensor_id
 
         self.sensor_ids = sensor_ids
+        self._sensor_items = tuple(sensor_ids.items())
 
     @property
     def index(self) -> str:
@@ -530,7 +574,7 @@ class Block:
     @property
     def channel(self) -> str | None:
         """Block description for channel."""
-        return self.description.split("_")[1] if "_" in self.description else None
+        return self._channel
 
     def info(self, attr: str) -> dict[str, Any]:
         """Return info over attribute."""
@@ -538,13 +582,11 @@ class Block:
 
     def current_values(self) -> dict[str, Any]:
         """Block values."""
-        if self.device.coap_s is None:
+        if (coap_s := self.device.coap_s) is None:
             return {}
 
-        return {
-            desc: self.device.coap_s.get(index)
-            for desc, index in self.sensor_ids.items()
-        }
+        get = coap_s.get
+        return {desc: get(index) for desc, index in self._sensor_items}
 
     async def set_state(self, **kwargs: Any) -> dict[str, Any]:
         """Set state request (HTTP)."""
@@ -558,7 +600,7 @@ class Block:
 
     def __getattr__(self, attr: str) -> str | None:
         """Get attribute."""
-        if attr not in self.sensor_ids:
+        if (sensor_id := self.sensor_ids.get(attr, UNDEFINED)) is UNDEFINED:
             msg = (
                 f"Device {self.device.model} with firmware "
                 f"{self.device.firmware_version} has no attribute '{attr}' "
@@ -566,10 +608,10 @@ class Block:
             )
             raise AttributeError(msg)
 
-        if self.device.coap_s is None:
+        if (coap_s := self.device.coap_s) is None:
             return None
 
-        return self.device.coap_s.get(self.sensor_ids[attr])
+        return coap_s.get(sensor_id)
 
     def __str__(self) -> str:
         """Format string."""
@@ -579,6 +621,8 @@ class Block:
 class LightBlock(Block, blk_type="light"):
     """Get light status."""
 
+    __slots__ = ()
+
     async def set_state(self, **kwargs: Any) -> dict[str, Any]:
         """Set light state."""
         if self.device.settings["device"]["type"] == MODEL_RGBW2:
@@ -5,11 +5,12 @@ from __future__ import annotations
 import asyncio
 import ipaddress
 import logging
-from dataclasses import dataclass
-from socket import gethostbyname
+import re
+import socket
+from dataclasses import dataclass, field, replace
 from typing import Any
 
-from aiohttp import BasicAuth, ClientSession, ClientTimeout
+from aiohttp import BasicAuth, ClientSession, ClientTimeout, TCPConnector, hdrs
 from yarl import URL
 
 from .const import (
@@ -17,7 +18,8 @@ from .const import (
     DEFAULT_HTTP_PORT,
     DEVICE_IO_TIMEOUT,
     DEVICES,
-    FIRMWARE_PATTERN,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_LIMIT_PER_HOST,
     MIN_FIRMWARE_DATES,
 )
 from .exceptions import (
@@ -25,13 +27,17 @@ from .exceptions import (
     DeviceConnectionTimeoutError,
     MacAddressMismatchError,
 )
+from .json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+_IPV4_OCTET = r"(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])"
+_IPV4_PATTERN = re.compile(rf"(?:{_IPV4_OCTET}\.){{3}}{_IPV4_OCTET}")
+
 DEVICE_IO_TIMEOUT_CLIENT_TIMEOUT = ClientTimeout(total=DEVICE_IO_TIMEOUT)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectionOptions:
     """Shelly options for connection."""
 
@@ -42,6 +48,9 @@ class ConnectionOptions:
     auth: BasicAuth | None = None
     device_mac: str | None = None
     port: int = DEFAULT_HTTP_PORT
+    _auth_header: dict[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Call after initialization."""
@@ -51,10 +60,30 @@ class ConnectionOptions:
 
             object.__setattr__(self, "auth", BasicAuth(self.username, self.password))
 
+        if self.auth is not None:
+            # Encode once instead of on every HTTP request
+            object.__setattr__(
+                self, "_auth_header", {hdrs.AUTHORIZATION: self.auth.encode()}
+            )
+
 
 IpOrOptionsType = str | ConnectionOptions
 
 
+def create_client_session() -> ClientSession:
+    """Create an aiohttp session tuned for talking to Shelly devices.
+
+    The session should be created once and shared by all devices, so
+    connections to the devices are kept alive between requests.
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            limit_per_host=HTTP_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        )
+    )
+
+
 async def process_ip_or_options(ip_or_options: IpOrOptionsType) -> ConnectionOptions:
     """Return ConnectionOptions class from ip str or ConnectionOptions."""
     if isinstance(ip_or_options, str):
@@ -62,15 +91,27 @@ async def process_ip_or_options(ip_or_options: IpOrOptionsType) -> ConnectionOpt
     else:
         options = ip_or_options
 
+    if _is_ip_address(options.ip_address):
+        return options
+
+    loop = asyncio.get_running_loop()
+    addr_infos = await loop.getaddrinfo(
+        options.ip_address, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+    )
+    return replace(options, ip_address=addr_infos[0][4][0])
+
+
+def _is_ip_address(host: str) -> bool:
+    """Return True if host is an IP address literal."""
+    # Fast path for the common IPv4 case, avoids raising ValueError
+    if _IPV4_PATTERN.fullmatch(host):
+        return True
+
     try:
-        ipaddress.ip_address(options.ip_address)
+        ipaddress.ip_address(host)
     except ValueError:
-        loop = asyncio.get_running_loop()
-        options.ip_address = await loop.run_in_executor(
-            None, gethostbyname, options.ip_address
-        )
-
-    return options
+        return False
+    return True
 
 
 async def get_info(
@@ -89,7 +130,7 @@ async def get_info(
             raise_for_status=True,
             timeout=DEVICE_IO_TIMEOUT_CLIENT_TIMEOUT,
         ) as resp:
-            result: dict[str, Any] = await resp.json()
+            result: dict[str, Any] = await resp.json(loads=json_loads)
     except TimeoutError as err:
         error = DeviceConnectionTimeoutError(err)
         _LOGGER.debug("host %s:%s: timeout error: %r", ip_address, port, error)
@@ -120,9 +161,11 @@ def is_firmware_supported(gen: int, model: str, firmware_version: str) -> bool:
         # Protection against future generations of devices.
         return False
 
-    match = FIRMWARE_PATTERN.search(firmware_version)
-    if match is None:
+    # Firmware version starts with the 8 digit release date (FIRMWARE_PATTERN),
+    # check it directly instead of going through the regex engine.
+    fw_date = firmware_version[:8]
+    if len(fw_date) != 8 or not fw_date.isdecimal():  # noqa: PLR2004
         return False
     # We compare firmware release dates because Shelly version numbering is
     # inconsistent, sometimes the word is used as the version number.
-    return int(match[0]) >= fw_ver
+    return int(fw_date) >= fw_ver
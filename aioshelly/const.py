@@ -3,6 +3,7 @@
 import re
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 import aiohttp
 
@@ -1017,7 +1018,7 @@ class UndefinedType(Enum):
 
 UNDEFINED = UndefinedType._singleton  # noqa: SLF001
 
-MODEL_NAMES = {data.model: data.name for data in DEVICES.values()}
+MODEL_NAMES = MappingProxyType({data.model: data.name for data in DEVICES.values()})
 
 # Timeout used for Device IO
 DEVICE_IO_TIMEOUT = 10.0
@@ -1032,6 +1033,11 @@ DEVICE_INIT_TIMEOUT = 30.0
 # Timeout used for HTTP calls
 HTTP_CALL_TIMEOUT = 10.0
 
+# Connection pool settings for the shared HTTP session, Shelly devices
+# handle only a few concurrent connections
+HTTP_LIMIT_PER_HOST = 4
+HTTP_KEEPALIVE_TIMEOUT = 75.0
+
 WS_HEARTBEAT = 55
 
 # Default network settings for gen1 devices ( CoAP )
@@ -352,9 +352,10 @@ class RpcDevice:
         """Set script code from 'Script.PutCode'."""
         await self.call_rpc("Script.PutCode", {"id": script_id, "code": code})
 
-    async def script_create(self, name: str) -> None:
-        """Create a script using 'Script.Create'."""
-        await self.call_rpc("Script.Create", {"name": name})
+    async def script_create(self, name: str) -> int:
+        """Create a script using 'Script.Create', return the new script id."""
+        data = await self.call_rpc("Script.Create", {"name": name})
+        return cast(int, data["id"])
 
     async def script_start(self, script_id: int) -> None:
         """Start a script using 'Script.Start'."""
@@ -0,0 +1 @@
+"""Tests for BLE support."""
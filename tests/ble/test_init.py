@@ -0,0 +1,138 @@
+"""Tests for ble module."""
+
+from unittest.mock import ANY, AsyncMock
+
+import pytest
+
+from aioshelly.ble import (
+    async_ensure_ble_enabled,
+    async_start_scanner,
+    async_stop_scanner,
+)
+from aioshelly.ble.const import BLE_SCRIPT_NAME
+from aioshelly.exceptions import RpcCallError
+from aioshelly.rpc_device import RpcDevice
+
+
+def mock_rpc_device(scripts: list[dict]) -> AsyncMock:
+    """Mock an RPC device with scripts."""
+    device = AsyncMock(spec=RpcDevice)
+    device.script_list.return_value = scripts
+    device.script_getcode.return_value = {"data": ""}
+    return device
+
+
+@pytest.mark.asyncio
+async def test_start_scanner_creates_script() -> None:
+    """Test starting the scanner creates the script when missing."""
+    device = mock_rpc_device([])
+    device.script_create.return_value = 3
+
+    await async_start_scanner(device, True, "ble.scan_result", 2)
+
+    device.script_create.assert_awaited_once_with(BLE_SCRIPT_NAME)
+    device.script_list.assert_awaited_once()
+    device.script_putcode.assert_awaited_once()
+    script_id, code = device.script_putcode.call_args[0]
+    assert script_id == 3  # noqa: PLR2004
+    assert "active: true," in code
+    assert '"ble.scan_result", [\n        2,' in code
+    assert "%" not in code
+    device.script_start.assert_awaited_once_with(3)
+
+
+@pytest.mark.asyncio
+async def test_scanner_caches_script_id() -> None:
+    """Test the script id is cached between start and stop."""
+    device = mock_rpc_device([{"id": 1, "name": BLE_SCRIPT_NAME}])
+
+    await async_start_scanner(device, True, "ble.scan_result", 2)
+    await async_stop_scanner(device)
+    await async_start_scanner(device, True, "ble.scan_result", 2)
+
+    assert device.script_list.await_count == 1
+    # Code is checked again after a stop
+    assert device.script_getcode.await_count == 2  # noqa: PLR2004
+    device.script_stop.assert_awaited_with(1)
+    device.script_start.assert_awaited_with(1)
+
+
+@pytest.mark.asyncio
+async def test_start_scanner_stale_script_id() -> None:
+    """Test starting the scanner recovers from a stale cached script id."""
+    device = mock_rpc_device([{"id": 1, "name": BLE_SCRIPT_NAME}])
+    await async_start_scanner(device, True, "ble.scan_result", 2)
+
+    # Script removed from the device, it is looked up again and recreated
+    device.script_list.return_value = []
+    device.script_create.return_value = 2
+    device.script_start.side_effect = [RpcCallError(-105, "not found"), None]
+    await async_start_scanner(device, True, "ble.scan_result", 2)
+
+    assert device.script_list.await_count == 2  # noqa: PLR2004
+    device.script_create.assert_awaited_once_with(BLE_SCRIPT_NAME)
+    device.script_putcode.assert_awaited_with(2, ANY)
+    device.script_start.assert_awaited_with(2)
+
+    # Start keeps failing after the retry
+    device.script_start.side_effect = RpcCallError(-103, "failed")
+    with pytest.raises(RpcCallError):
+        await async_start_scanner(device, True, "ble.scan_result", 2)
+    assert device.script_list.await_count == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_stop_scanner_stale_script_id() -> None:
+    """Test stopping the scanner recovers from a stale cached script id."""
+    device = mock_rpc_device([{"id": 1, "name": BLE_SCRIPT_NAME}])
+    await async_start_scanner(device, True, "ble.scan_result", 2)
+
+    # Script recreated with a new id
+    device.script_list.return_value = [{"id": 4, "name": BLE_SCRIPT_NAME}]
+    device.script_stop.side_effect = [RpcCallError(-105, "not found"), None]
+    await async_stop_scanner(device)
+    device.script_stop.assert_awaited_with(4)
+
+    # Script removed from the device, nothing left to stop
+    device.script_list.return_value = []
+    device.script_stop.reset_mock(side_effect=True)
+    device.script_stop.side_effect = RpcCallError(-105, "not found")
+    await async_stop_scanner(device)
+    device.script_stop.assert_awaited_once_with(4)
+    assert device.script_list.await_count == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_start_scanner_skips_getcode() -> None:
+    """Test script code is only read back when it may have changed."""
+    device = mock_rpc_device([{"id": 1, "name": BLE_SCRIPT_NAME}])
+
+    await async_start_scanner(device, True, "ble.scan_result", 2)
+    await async_start_scanner(device, True, "ble.scan_result", 2)
+    assert device.script_getcode.await_count == 1
+    assert device.script_putcode.await_count == 1
+
+    # Different parameters change the code
+    await async_start_scanner(device, False, "ble.scan_result", 2)
+    assert device.script_getcode.await_count == 2  # noqa: PLR2004
+    assert device.script_putcode.await_count == 2  # noqa: PLR2004
+    assert device.script_start.await_count == 3  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("ble_config", "set_config"),
+    [
+        ({"enable": True, "rpc": {"enable": True}}, False),
+        ({"enable": True}, False),
+        ({"enable": False, "rpc": {"enable": True}}, True),
+    ],
+)
+@pytest.mark.asyncio
+async def test_ensure_ble_enabled(ble_config: dict, set_config: bool) -> None:
+    """Test BLE config is only set when not already enabled."""
+    device = mock_rpc_device([])
+    device.ble_getconfig.return_value = ble_config
+    device.ble_setconfig.return_value = {"restart_required": False}
+
+    assert await async_ensure_ble_enabled(device) is False
+    assert device.ble_setconfig.await_count == set_config
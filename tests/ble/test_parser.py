@@ -0,0 +1,78 @@
+"""Tests for ble.parser module."""
+
+import pytest
+
+from aioshelly.ble import parser
+from aioshelly.ble.parser import parse_ble_scan_result_event
+
+# Flags + complete local name "Shelly"
+ADV_DATA_B64 = "AgEGBwlTaGVsbHk="
+PARSED_ADV = ("Shelly", [], {}, {}, None)
+
+
+def test_parse_v1() -> None:
+    """Test parsing a version 1 scan result."""
+    assert parse_ble_scan_result_event(
+        [1, "aa:bb:cc:dd:ee:ff", -60, ADV_DATA_B64, ""]
+    ) == [("AA:BB:CC:DD:EE:FF", -60, PARSED_ADV)]
+
+
+def test_parse_v2() -> None:
+    """Test parsing a version 2 scan result."""
+    assert parse_ble_scan_result_event(
+        [
+            2,
+            [
+                ["aa:bb:cc:dd:ee:ff", -60, ADV_DATA_B64, ""],
+                ["11:22:33:44:55:66", -70, "", ADV_DATA_B64],
+            ],
+        ]
+    ) == [
+        ("AA:BB:CC:DD:EE:FF", -60, PARSED_ADV),
+        ("11:22:33:44:55:66", -70, PARSED_ADV),
+    ]
+
+
+def test_parse_adv_and_scan_response() -> None:
+    """Test parsing a scan result with both advertisement and scan response."""
+    # Flags (unpadded) + tx power -12, and padded local name + tx power -12
+    assert parse_ble_scan_result_event(
+        [
+            2,
+            [
+                ["aa:bb:cc:dd:ee:ff", -60, "AgEG", "Agr0"],
+                ["11:22:33:44:55:66", -70, ADV_DATA_B64, "Agr0"],
+            ],
+        ]
+    ) == [
+        ("AA:BB:CC:DD:EE:FF", -60, (None, [], {}, {}, -12)),
+        ("11:22:33:44:55:66", -70, ("Shelly", [], {}, {}, -12)),
+    ]
+
+
+def test_parse_unsupported_version() -> None:
+    """Test parsing an unsupported scan result version."""
+    with pytest.raises(ValueError, match="Unsupported BLE scan result version: 3"):
+        parse_ble_scan_result_event([3, []])
+
+
+def test_upper_cache_is_bounded() -> None:
+    """Test the address upper-case cache is cleared when full."""
+    parser._UPPER_CACHE.clear()  # noqa: SLF001
+    for idx in range(parser._MAX_UPPER_CACHE_SIZE):  # noqa: SLF001
+        assert parser._upper(f"aa:{idx:x}") == f"AA:{idx:X}"  # noqa: SLF001
+    assert len(parser._UPPER_CACHE) == parser._MAX_UPPER_CACHE_SIZE  # noqa: SLF001
+
+    assert parser._upper("bb:cc") == "BB:CC"  # noqa: SLF001
+    assert parser._UPPER_CACHE == {"bb:cc": "BB:CC"}  # noqa: SLF001
+
+
+def test_repeated_advertisement_is_cached() -> None:
+    """Test a repeated advertisement payload reuses the parsed result."""
+    parser._parse_advertisement.cache_clear()  # noqa: SLF001
+    first = parse_ble_scan_result_event([1, "aa:bb:cc:dd:ee:ff", -60, ADV_DATA_B64, ""])
+    second = parse_ble_scan_result_event(
+        [1, "aa:bb:cc:dd:ee:ff", -61, ADV_DATA_B64, ""]
+    )
+    assert first[0][2] is second[0][2]
+    assert parser._parse_advertisement.cache_info().hits == 1  # noqa: SLF001
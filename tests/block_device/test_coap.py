@@ -0,0 +1,155 @@
+"""Tests for block_device.coap module."""
+
+import logging
+import struct
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from aioshelly.block_device.coap import (
+    COAP,
+    COAP_OPTION_DEVICE_ID,
+    CoapMessage,
+    CoapType,
+    InvalidMessage,
+)
+
+DEVICE_ID = b"SHSW-1#A1B2C3#2"
+
+
+def build_message(code: int, payload: bytes, device_id: bytes = DEVICE_ID) -> bytes:
+    """Build a CoAP message with a device id option."""
+    # Option delta 3332 and length 15 use the 2 and 1 byte extended formats
+    option = struct.pack("!BHB", 0xED, COAP_OPTION_DEVICE_ID - 269, len(device_id) - 13)
+    return struct.pack("!BBH", 0x50, code, 1) + option + device_id + b"\xff" + payload
+
+
+@pytest.mark.parametrize(
+    ("code", "coap_type"), [(30, CoapType.PERIODIC), (69, CoapType.REPLY)]
+)
+def test_coap_message(code: int, coap_type: CoapType) -> None:
+    """Test parsing a CoAP message."""
+    msg = CoapMessage(("10.10.10.10", 5683), build_message(code, b'{"G":[[0,1,2]]}'))
+
+    assert msg.ip == "10.10.10.10"
+    assert msg.code == code
+    assert msg.coap_type is coap_type
+    assert msg.options == {COAP_OPTION_DEVICE_ID: DEVICE_ID}
+    assert msg.payload == {"G": [[0, 1, 2]]}
+    assert not hasattr(msg, "__dict__")
+
+
+@pytest.mark.parametrize(
+    ("data", "error"),
+    [
+        (b"\x50\x45", "Message too short"),
+        (build_message(1, b"{}"), "Wrong type, 1"),
+        (build_message(69, b""), "Received message without data"),
+        (build_message(69, b'{"G":"\xff"}'), "is not a valid JSON format"),
+        (build_message(69, b"{}")[:8], "Option announced but absent"),
+        (build_message(69, b"{}")[:6], "Option ended prematurely"),
+        (b"\x50\x45\x00\x01\xf0", "Option contained partial payload marker"),
+    ],
+)
+def test_coap_message_invalid(data: bytes, error: str) -> None:
+    """Test parsing an invalid CoAP message."""
+    with pytest.raises(InvalidMessage, match=error):
+        CoapMessage(("10.10.10.10", 5683), data)
+
+
+@pytest.mark.asyncio
+async def test_coap_request() -> None:
+    """Test sending a CoAP request."""
+    coap = COAP()
+    coap.transport = MagicMock()
+
+    await coap.request("10.10.10.10", "s")
+    await coap.request("10.10.10.10", "d")
+
+    assert coap.transport.sendto.call_args_list == [
+        call(b"\x50\x01\x00\x0a\xb3cit\x01s\xff\x00", ("10.10.10.10", 5683)),
+        call(b"\x50\x01\x00\x0a\xb3cit\x01d\xff\x00", ("10.10.10.10", 5683)),
+    ]
+
+
+def test_datagram_received_dispatch() -> None:
+    """Test messages are dispatched by device id, falling back to host."""
+    by_device_id = MagicMock()
+    by_host = MagicMock()
+    coap = COAP()
+    coap.subscribe_updates("A1B2C3", by_device_id)
+    coap.subscribe_updates("10.10.10.11", by_host)
+
+    coap.datagram_received(build_message(30, b"{}"), ("10.10.10.10", 5683))
+    coap.datagram_received(
+        build_message(30, b"{}", b"SHSW-1#D4E5F6#2"), ("10.10.10.11", 5683)
+    )
+    coap.datagram_received(
+        build_message(30, b"{}", b"SHSW-1#D4E5F6#2"), ("10.10.10.12", 5683)
+    )
+
+    assert [msg.ip for (msg,), _ in by_device_id.call_args_list] == ["10.10.10.10"]
+    assert [msg.ip for (msg,), _ in by_host.call_args_list] == ["10.10.10.11"]
+
+
+@pytest.mark.parametrize("device_id", [b"SHSW-1-A1B2C3", b"SHSW-1#\xffB2C3#2"])
+def test_datagram_received_invalid_device_id(device_id: bytes) -> None:
+    """Test messages with an invalid device id are not dispatched."""
+    callback = MagicMock()
+    coap = COAP()
+    coap.subscribe_updates("10.10.10.10", callback)
+
+    coap.datagram_received(build_message(30, b"{}", device_id), ("10.10.10.10", 5683))
+
+    callback.assert_not_called()
+
+
+def test_datagram_received_unsubscribed_skips_payload() -> None:
+    """Test the payload is only parsed when the message has a receiver."""
+    coap = COAP()
+    coap.subscribe_updates("10.10.10.11", MagicMock())
+
+    with patch("aioshelly.block_device.coap.json_loads") as json_loads:
+        coap.datagram_received(build_message(30, b"{}"), ("10.10.10.10", 5683))
+        json_loads.assert_not_called()
+
+        coap.datagram_received(build_message(30, b"{}"), ("10.10.10.11", 5683))
+        json_loads.assert_called_once_with(b"{}")
+
+
+def test_datagram_received_message_received() -> None:
+    """Test the global listener receives every valid message."""
+    message_received = MagicMock()
+    coap = COAP(message_received)
+
+    coap.datagram_received(build_message(30, b'{"G":[]}'), ("10.10.10.10", 5683))
+    coap.datagram_received(build_message(30, b"{"), ("10.10.10.10", 5683))
+
+    assert [msg.payload for (msg,), _ in message_received.call_args_list] == [{"G": []}]
+
+
+def test_datagram_received_invalid_payload(caplog: pytest.LogCaptureFixture) -> None:
+    """Test a subscribed message with invalid JSON is not dispatched."""
+    callback = MagicMock()
+    coap = COAP()
+    coap.subscribe_updates("A1B2C3", callback)
+
+    with caplog.at_level(logging.DEBUG):
+        coap.datagram_received(build_message(30, b"{"), ("10.10.10.10", 5683))
+
+    callback.assert_not_called()
+    assert "Invalid Message from host 10.10.10.10" in caplog.text
+    assert "Calling CoAP message update" not in caplog.text
+
+
+@pytest.mark.parametrize("data", [b"\x50\x45", build_message(1, b"{}")])
+def test_datagram_received_not_shelly(data: bytes) -> None:
+    """Test short or non Shelly messages are dropped before parsing."""
+    message_received = MagicMock()
+    coap = COAP(message_received)
+
+    with patch("aioshelly.block_device.coap.CoapMessage") as coap_message:
+        coap.datagram_received(data, ("10.10.10.10", 5683))
+
+    coap_message.assert_not_called()
+    message_received.assert_not_called()
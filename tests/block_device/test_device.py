@@ -0,0 +1,236 @@
+"""Tests for block_device.device module."""
+
+import asyncio
+from copy import deepcopy
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from aioshelly.block_device.coap import CoapType
+from aioshelly.block_device.device import Block, BlockDevice, LightBlock
+from aioshelly.common import ConnectionOptions
+from aioshelly.exceptions import DeviceConnectionError
+
+
+@pytest.mark.parametrize(
+    ("description", "blk_type", "channel"),
+    [
+        ("relay_0", "relay", "0"),
+        ("light_1", "light", "1"),
+        ("device", "device", None),
+    ],
+)
+def test_block_create(description: str, blk_type: str, channel: str | None) -> None:
+    """Test block type and channel parsing."""
+    block = Block.create(MagicMock(), {"I": 1, "D": description}, {})
+
+    assert block.type == blk_type
+    assert block.channel == channel
+    assert isinstance(block, LightBlock) is (blk_type == "light")
+    assert not hasattr(block, "__dict__")
+
+
+def test_update_d_links_sensors_to_blocks() -> None:
+    """Test sensors are linked to all blocks referenced in their link."""
+    device = MagicMock()
+    BlockDevice._update_d(  # noqa: SLF001
+        device,
+        {
+            "blk": [{"I": 0, "D": "relay_0"}, {"I": 1, "D": "relay_1"}],
+            "sen": [
+                {"I": 111, "T": "P", "D": "power", "L": 0},
+                {"I": 112, "T": "P", "D": "power", "L": 1},
+                {"I": 9103, "T": "EVC", "D": "cfgChanged", "L": [0, 1]},
+            ],
+        },
+    )
+
+    assert [list(block.sensors) for block in device.blocks] == [
+        [111, 9103],
+        [112, 9103],
+    ]
+
+
+def test_update_d_unchanged_keeps_blocks() -> None:
+    """Test an unchanged description keeps the existing blocks."""
+    device = BlockDevice(MagicMock(), MagicMock(), ConnectionOptions("10.10.10.10"))
+    data = {
+        "blk": [{"I": 0, "D": "relay_0"}],
+        "sen": [{"I": 111, "T": "P", "D": "power", "L": 0}],
+    }
+    device._update_d(data)  # noqa: SLF001
+    blocks = device.blocks
+
+    device._update_d(deepcopy(data))  # noqa: SLF001
+    assert device.blocks is blocks
+
+    data = deepcopy(data)
+    data["blk"].append({"I": 1, "D": "relay_1"})
+    device._update_d(data)  # noqa: SLF001
+    assert [block.description for block in device.blocks] == ["relay_0", "relay_1"]
+
+
+def test_block_getattr() -> None:
+    """Test block sensor values are exposed as attributes."""
+    device = MagicMock(coap_s=None)
+    block = Block.create(
+        device,
+        {"I": 0, "D": "relay_0"},
+        {111: {"I": 111, "T": "P", "D": "power", "U": "W", "L": 0}},
+    )
+
+    assert block.power is None
+
+    device.coap_s = {111: "12.5"}
+    assert block.power == "12.5"
+
+    with pytest.raises(AttributeError, match="has no attribute 'energy'"):
+        _ = block.energy
+
+
+def test_block_current_values() -> None:
+    """Test block current values."""
+    device = MagicMock(coap_s=None)
+    block = Block.create(
+        device,
+        {"I": 0, "D": "relay_0"},
+        {
+            111: {"I": 111, "T": "P", "D": "power", "U": "W", "L": 0},
+            112: {"I": 112, "T": "S", "D": "output", "L": 0},
+        },
+    )
+
+    assert block.current_values() == {}
+
+    device.coap_s = {111: "12.5"}
+    assert block.current_values() == {"power": "12.5", "output": None}
+
+
+def test_update_s() -> None:
+    """Test CoAP status is mapped by sensor id."""
+    device = MagicMock(_update_listener=None)
+    BlockDevice._update_s(  # noqa: SLF001
+        device, {"G": [[0, 111, "12.5"], [0, 112, 1]]}, CoapType.REPLY
+    )
+
+    assert device.coap_s == {111: "12.5", 112: 1}
+
+
+@pytest.mark.asyncio
+async def test_coap_request_reuses_event() -> None:
+    """Test CoAP response events are reused between requests."""
+    coap_context = MagicMock(request=AsyncMock())
+    device = BlockDevice(coap_context, MagicMock(), ConnectionOptions("10.10.10.10"))
+    msg = MagicMock(payload={"G": [[0, 111, 1]]}, coap_type=CoapType.REPLY)
+
+    event = await device._coap_request("s")  # noqa: SLF001
+    assert not event.is_set()
+
+    device._coap_message_received(msg)  # noqa: SLF001
+    assert event.is_set()
+    assert device.coap_s == {111: 1}
+
+    assert await device._coap_request("s") is event  # noqa: SLF001
+    assert not event.is_set()
+    coap_context.request.assert_called_with("10.10.10.10", "s")
+
+
+@pytest.mark.asyncio
+async def test_initialize() -> None:
+    """Test device initialization fetches HTTP and CoAP data."""
+    coap_context = MagicMock(request=AsyncMock())
+    device = BlockDevice(coap_context, MagicMock(), ConnectionOptions("10.10.10.10"))
+    payloads = {
+        "d": {
+            "blk": [{"I": 0, "D": "relay_0"}],
+            "sen": [{"I": 111, "T": "P", "D": "power", "U": "W", "L": 0}],
+        },
+        "s": {"G": [[0, 111, "12.5"]]},
+    }
+
+    async def _coap_reply(_ip: str, path: str) -> None:
+        msg = MagicMock(payload=payloads[path], coap_type=CoapType.REPLY)
+        loop = asyncio.get_running_loop()
+        loop.call_soon(device._coap_message_received, msg)  # noqa: SLF001
+
+    coap_context.request.side_effect = _coap_reply
+    shelly = {"type": "SHSW-1", "fw": "20230913-112003/v1.14.0-gcb84623", "auth": False}
+
+    with (
+        patch("aioshelly.block_device.device.get_info", return_value=shelly),
+        patch.object(device, "http_request", return_value={"name": "test"}),
+    ):
+        await device.initialize()
+
+    assert device.initialized
+    assert device.settings == {"name": "test"}
+    assert device.status == {"name": "test"}
+    assert device.blocks[0].power == "12.5"
+
+
+@pytest.mark.asyncio
+async def test_initialize_failure_waits_for_tasks() -> None:
+    """Test remaining init calls have finished when initialize fails."""
+    device = BlockDevice(MagicMock(), MagicMock(), ConnectionOptions("10.10.10.10"))
+    shelly = {"type": "SHSW-1", "fw": "20230913-112003/v1.14.0-gcb84623", "auth": False}
+    coap_finished = False
+
+    async def _coap_initialize() -> None:
+        nonlocal coap_finished
+        try:
+            await asyncio.sleep(10)
+        finally:
+            coap_finished = True
+
+    with (
+        patch("aioshelly.block_device.device.get_info", return_value=shelly),
+        patch.object(device, "http_request", side_effect=DeviceConnectionError),
+        patch.object(device, "_coap_initialize", _coap_initialize),
+        pytest.raises(DeviceConnectionError),
+    ):
+        await device.initialize()
+
+    assert coap_finished
+    assert not device.initialized
+
+
+@pytest.mark.parametrize(("temperature_unit", "sensor_id"), [("C", 113), ("F", 114)])
+def test_block_temperature_unit(temperature_unit: str, sensor_id: int) -> None:
+    """Test duplicate temperature descriptions use the configured unit."""
+    device = MagicMock()
+    device.options.temperature_unit = temperature_unit
+    sensors = {
+        113: {"I": 113, "T": "T", "D": "temp", "U": "C", "L": 0},
+        114: {"I": 114, "T": "T", "D": "temp", "U": "F", "L": 0},
+    }
+    block = Block.create(device, {"I": 0, "D": "sensor_0"}, sensors)
+
+    assert block.sensor_ids == {"temp": sensor_id}
+
+
+def test_block_duplicate_description() -> None:
+    """Test duplicate descriptions are only allowed for temperature sensors."""
+    sensors = {
+        111: {"I": 111, "T": "P", "D": "power", "U": "W", "L": 0},
+        112: {"I": 112, "T": "P", "D": "power", "U": "W", "L": 0},
+    }
+
+    with pytest.raises(ValueError, match="duplicate description"):
+        Block.create(MagicMock(), {"I": 0, "D": "relay_0"}, sensors)
+
+
+@pytest.mark.asyncio
+async def test_http_request_caches_url() -> None:
+    """Test the request URL is built once per path."""
+    session = MagicMock()
+    session.request = AsyncMock()
+    session.request.return_value.json = AsyncMock(return_value={"ok": True})
+    device = BlockDevice(MagicMock(), session, ConnectionOptions("10.10.10.10"))
+    device._shelly = {"auth": False}  # noqa: SLF001
+
+    assert await device.http_request("get", "settings/relay/0") == {"ok": True}
+    assert await device.http_request("get", "settings/relay/0") == {"ok": True}
+
+    first_url = session.request.call_args_list[0].args[1]
+    assert str(first_url) == "http://10.10.10.10/settings/relay/0"
+    assert session.request.call_args_list[1].args[1] is first_url
@@ -1,5 +1,7 @@
 """Tests for common module."""
 
+import asyncio
+from socket import AF_INET, SOCK_STREAM
 from unittest.mock import patch
 
 import pytest
@@ -9,11 +11,16 @@ from yarl import URL
 
 from aioshelly.common import (
     ConnectionOptions,
+    create_client_session,
     get_info,
     is_firmware_supported,
     process_ip_or_options,
 )
-from aioshelly.const import DEFAULT_HTTP_PORT
+from aioshelly.const import (
+    DEFAULT_HTTP_PORT,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_LIMIT_PER_HOST,
+)
 from aioshelly.exceptions import (
     DeviceConnectionError,
     DeviceConnectionTimeoutError,
@@ -33,6 +40,8 @@ from .rpc_device import load_device_fixture
         (2, "SNDC-0D4P10WW", "20230703-112054/0.99.0-gcb84623", False),
         (3, "UNKNOWN", "20240819-074343/1.4.20-gc2639da", True),
         (3, "S3SW-002P16EU", "strange-firmware-version", False),
+        (3, "S3SW-002P16EU", "2024081", False),
+        (3, "S3SW-002P16EU", "2024O819-074343/1.4.20-gc2639da", False),
     ],
 )
 def test_is_firmware_supported(
@@ -50,20 +59,50 @@ async def test_process_ip_or_options() -> None:
     # Test string numeric IP address
     assert await process_ip_or_options(ip) == ConnectionOptions(ip)
 
+    loop = asyncio.get_running_loop()
+
+    # Test IP addresses are not resolved
+    with patch.object(loop, "getaddrinfo") as mock_getaddrinfo:
+        for address in ("10.0.0.255", "fe80::1"):
+            assert await process_ip_or_options(address) == ConnectionOptions(address)
+        mock_getaddrinfo.assert_not_called()
+
     # Test string hostname IP address
-    with patch("aioshelly.common.gethostbyname", return_value=ip):
+    addr_infos = [(AF_INET, SOCK_STREAM, 6, "", (ip, 0))]
+    with patch.object(loop, "getaddrinfo", return_value=addr_infos):
         assert await process_ip_or_options("some_host") == ConnectionOptions(ip)
 
     # Test ConnectionOptions
     options = ConnectionOptions(ip, "user", "pass")
     assert await process_ip_or_options(options) == options
     assert options.auth == BasicAuth("user", "pass")
+    auth_header = {"Authorization": "Basic dXNlcjpwYXNz"}
+    assert options._auth_header == auth_header  # noqa: SLF001
+    assert ConnectionOptions(ip)._auth_header is None  # noqa: SLF001
+
+    # Test ConnectionOptions with hostname is not modified in place
+    options = ConnectionOptions("some_host", "user", "pass")
+    with patch.object(loop, "getaddrinfo", return_value=addr_infos):
+        assert await process_ip_or_options(options) == ConnectionOptions(
+            ip, "user", "pass"
+        )
+    assert options.ip_address == "some_host"
 
     # Test missing password
     with pytest.raises(ValueError, match="Supply both username and password"):
         options = ConnectionOptions(ip, "user")
 
 
+@pytest.mark.asyncio
+async def test_create_client_session() -> None:
+    """Test create_client_session function."""
+    async with create_client_session() as session:
+        connector = session.connector
+        assert connector is not None
+        assert connector.limit_per_host == HTTP_LIMIT_PER_HOST
+        assert connector._keepalive_timeout == HTTP_KEEPALIVE_TIMEOUT  # noqa: SLF001
+
+
 @pytest.mark.asyncio
 async def test_get_info() -> None:
     """Test get_info function."""
@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any, cast
 from aiohttp import ClientSession
 
 from aioshelly.block_device import BLOCK_VALUE_UNIT, COAP, BlockDevice, BlockUpdateType
-from aioshelly.common import ConnectionOptions, get_info
+from aioshelly.common import ConnectionOptions, create_client_session, get_info
 from aioshelly.const import (
     BLOCK_GENERATIONS,
     DEFAULT_HTTP_PORT,
@@ -183,7 +183,7 @@ async def update_outbound_ws(
     options: ConnectionOptions, init: bool, ws_url: str
 ) -> None:
     """Update outbound WebSocket URL (Gen2/3)."""
-    async with ClientSession() as aiohttp_session:
+    async with create_client_session() as aiohttp_session:
         device: RpcDevice = await create_device(aiohttp_session, options, init, 2)
         print(f"Updating outbound weboskcet URL to {ws_url}")
         print(f"Restart required: {await device.update_outbound_websocket(ws_url)}")
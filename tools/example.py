@@ -11,7 +11,6 @@ import traceback
 from functools import partial
 from pathlib import Path
 
-from aiohttp import ClientSession
 from common import (
     close_connections,
     coap_context,
@@ -25,13 +24,13 @@ from common import (
     ws_context,
 )
 
-from aioshelly.common import ConnectionOptions
+from aioshelly.common import ConnectionOptions, create_client_session
 from aioshelly.const import DEFAULT_HTTP_PORT, WS_API_URL
 
 
 async def test_single(options: ConnectionOptions, init: bool, gen: int | None) -> None:
     """Test single device."""
-    async with ClientSession() as aiohttp_session:
+    async with create_client_session() as aiohttp_session:
         device = await create_device(aiohttp_session, options, gen)
 
         if init and not await init_device(device):
@@ -54,7 +53,7 @@ async def test_devices(init: bool, gen: int | None) -> None:
     with Path.open("devices.json", encoding="utf8") as fp:
         device_options = [ConnectionOptions(**json.loads(line)) for line in fp]
 
-    async with ClientSession() as aiohttp_session:
+    async with create_client_session() as aiohttp_session:
         results = await asyncio.gather(
             *[
                 asyncio.gather(
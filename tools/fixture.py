@@ -14,7 +14,6 @@ from types import FrameType
 from typing import Any
 
 import orjson
-from aiohttp import ClientSession
 from common import (
     close_connections,
     coap_context,
@@ -25,7 +24,7 @@ from common import (
 )
 
 from aioshelly.block_device import BlockDevice
-from aioshelly.common import ConnectionOptions
+from aioshelly.common import ConnectionOptions, create_client_session
 from aioshelly.const import BLOCK_GENERATIONS, DEVICES, WS_API_URL
 from aioshelly.rpc_device import RpcDevice
 
@@ -34,7 +33,7 @@ async def connect_and_save(
     options: ConnectionOptions, init: bool, gen: int | None
 ) -> None:
     """Save fixture single device."""
-    async with ClientSession() as aiohttp_session:
+    async with create_client_session() as aiohttp_session:
         device = await create_device(aiohttp_session, options, gen)
 
         if init: